@@ -4,15 +4,156 @@ A modern, user-friendly security testing tool using Requests, Selenium, and Burp
 """
 
 from flask import Flask, render_template, request, jsonify, send_file
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+import atexit
+import gzip
 import json
+import multiprocessing
+import orjson
 import os
+import re
+import shutil
+import tempfile
+import threading
 from core.scanner import SecurityScanner
-from core.report_generator import ReportGenerator
+
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for request parsing and jsonify()."""
+    
+    # Sorted keys match Flask's default provider. Unlike it, orjson writes
+    # non-ASCII text as raw UTF-8 rather than \uXXXX escapes and datetimes as
+    # ISO 8601 rather than HTTP dates; both are still valid JSON for clients
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes to the response directly instead of round-tripping through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.option), mimetype='application/json')
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
-scanner = SecurityScanner()
+# gzip/brotli for JSON API responses and HTML/JSON report downloads
+Compress(app)
+# One scanner is shared by every request and client, so its connection pools
+# and scan workers are created once per process and released on shutdown. It is
+# built on first use rather than at import: PDF workers are spawned processes that
+# re-import this module as __mp_main__ and must not build a scanner of their own
+_scanner = None
+_scanner_lock = threading.Lock()
+
+
+def _get_scanner() -> SecurityScanner:
+    """Return the process-wide scanner, creating it on first use."""
+    global _scanner
+    with _scanner_lock:
+        if _scanner is None:
+            _scanner = SecurityScanner()
+            atexit.register(_scanner.close)
+        return _scanner
+
+# Scan targets must be absolute http(s) URLs without whitespace
+_URL_RE = re.compile(r'https?://\S+', re.IGNORECASE)
+
+# Text reports are served from gzipped copies instead of through Flask-Compress,
+# which reads a whole file response into memory before compressing it
+_PRECOMPRESSED_FORMATS = ('html', 'json')
+
+
+def _gzipped_copy(path: str) -> str:
+    """
+    Return a gzip-compressed copy of a report, creating it on first use.
+    
+    Args:
+        path: Path of the generated report
+        
+    Returns:
+        Path of the .gz file next to the report
+    """
+    gz_path = path + '.gz'
+    if not os.path.exists(gz_path) or os.path.getmtime(gz_path) < os.path.getmtime(path):
+        # Compress in chunks so memory stays flat. Each request writes its own
+        # temporary file, so concurrent downloads of one report never share a
+        # half-written file; whichever finishes last replaces the .gz atomically
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(gz_path) or '.', suffix='.gz.tmp')
+        try:
+            with open(path, 'rb') as src, os.fdopen(fd, 'wb') as raw, \
+                    gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp_path, gz_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return gz_path
+
+
+# PDF rendering is CPU-bound ReportLab work, so it runs in worker processes where
+# it neither holds the GIL against API requests nor takes the app down if it crashes
+_PDF_WORKERS = 2
+_PDF_TIMEOUT = 60
+_pdf_pool = None
+_pdf_pool_hooked = False
+_pdf_pool_lock = threading.Lock()
+
+
+def _shutdown_pdf_pool():
+    """Stop the PDF worker pool, if one was started."""
+    with _pdf_pool_lock:
+        pool = _pdf_pool
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+
+def _render_pdf(scan_id: str) -> str:
+    """
+    Render a PDF report in the worker pool, starting the pool on first use.
+    
+    Args:
+        scan_id: Scan identifier
+        
+    Returns:
+        Path to the generated PDF
+    """
+    global _pdf_pool, _pdf_pool_hooked
+    from core.pdf_worker import render_pdf
+    
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            # Spawn fresh interpreters: forking would copy this process's scan
+            # threads, held locks and open HTTP connections into each worker
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=_PDF_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            # One hook for the process; pools rebuilt after a worker crash reuse it
+            if not _pdf_pool_hooked:
+                atexit.register(_shutdown_pdf_pool)
+                _pdf_pool_hooked = True
+        pool = _pdf_pool
+    
+    try:
+        return pool.submit(render_pdf, scan_id).result(timeout=_PDF_TIMEOUT)
+    except BrokenProcessPool:
+        # A worker died mid-render; drop the pool so the next download starts a fresh one
+        with _pdf_pool_lock:
+            if _pdf_pool is pool:
+                _pdf_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
 
 @app.route('/')
 def index():
@@ -27,16 +168,25 @@ def start_scan():
     scan_types = data.get('scan_types', ['all'])
     use_burp = data.get('use_burp', False)
     use_selenium = data.get('use_selenium', True)
+    parallel = data.get('parallel', True)
     
     if not target_url:
         return jsonify({'error': 'Target URL is required'}), 400
     
+    if not isinstance(target_url, str) or not _URL_RE.fullmatch(target_url):
+        return jsonify({'error': 'Target URL must start with http:// or https://'}), 400
+    
+    # A string such as "false" would be truthy, so only real booleans are accepted
+    if not isinstance(parallel, bool):
+        return jsonify({'error': 'parallel must be true or false'}), 400
+    
     try:
-        results = scanner.scan(
+        results = _get_scanner().scan(
             target_url=target_url,
             scan_types=scan_types,
             use_burp=use_burp,
-            use_selenium=use_selenium
+            use_selenium=use_selenium,
+            parallel=parallel
         )
         return jsonify(results)
     except Exception as e:
@@ -45,7 +195,7 @@ def start_scan():
 @app.route('/api/scan/status/<scan_id>')
 def scan_status(scan_id):
     """Get scan status."""
-    status = scanner.get_scan_status(scan_id)
+    status = _get_scanner().get_scan_status(scan_id)
     return jsonify(status)
 
 @app.route('/api/report/<scan_id>')
@@ -53,16 +203,45 @@ def generate_report(scan_id):
     """Generate PDF report."""
     format_type = request.args.get('format', 'pdf')
     try:
-        report_path = ReportGenerator.generate_report(scan_id, format_type)
+        # ReportLab and the Jinja report template load on the first download
+        # rather than at startup, since many sessions never export a report
+        from core.report_generator import ReportGenerator
+        # PDFs render in the worker pool; the report cache is checked here in the
+        # request process first, so repeat downloads skip the workers entirely
+        report_path = ReportGenerator.generate_report(scan_id, format_type, pdf_renderer=_render_pdf)
+        
+        if format_type in _PRECOMPRESSED_FORMATS and 'gzip' in request.accept_encodings:
+            response = send_file(
+                _gzipped_copy(report_path),
+                mimetype='text/html' if format_type == 'html' else 'application/json',
+                as_attachment=True,
+                download_name=os.path.basename(report_path)
+            )
+            # Flask-Compress leaves responses that already carry an encoding alone
+            response.headers['Content-Encoding'] = 'gzip'
+            response.headers['Vary'] = 'Accept-Encoding'
+            return response
+        
         return send_file(report_path, as_attachment=True)
+    except FutureTimeoutError:
+        return jsonify({'error': f'PDF generation took longer than {_PDF_TIMEOUT} seconds'}), 504
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/history')
 def scan_history():
-    """Get scan history."""
-    history = scanner.get_scan_history()
-    return jsonify(history)
+    """Get scan history: all of it oldest first, or one page newest first with limit/offset."""
+    limit = request.args.get('limit', type=int)
+    offset = request.args.get('offset', type=int)
+    if (limit is not None and limit < 0) or (offset is not None and offset < 0):
+        return jsonify({'error': 'limit and offset must be non-negative integers'}), 400
+    
+    scanner = _get_scanner()
+    history = scanner.get_scan_history(limit=limit, offset=offset)
+    response = jsonify(history)
+    # The body stays a plain list; the total lets clients page through it
+    response.headers['X-Total-Count'] = str(scanner.get_history_count())
+    return response
 
 if __name__ == '__main__':
     os.makedirs('reports', exist_ok=True)
@@ -3,7 +3,7 @@
 from .scanner import SecurityScanner
 from .vulnerability_scanner import VulnerabilityScanner
 from .burp_integration import BurpIntegration
-from .report_generator import ReportGenerator
+from .findings import Finding
 
 try:
     from .selenium_scanner import SeleniumScanner
@@ -14,8 +14,18 @@ __all__ = [
     'SecurityScanner',
     'VulnerabilityScanner',
     'BurpIntegration',
-    'ReportGenerator'
+    'ReportGenerator',
+    'Finding'
 ]
 
 if SeleniumScanner:
     __all__.append('SeleniumScanner')
+
+
+def __getattr__(name):
+    # ReportGenerator pulls in ReportLab and the report template, so it is only
+    # imported the first time core.ReportGenerator is looked up
+    if name == 'ReportGenerator':
+        from .report_generator import ReportGenerator
+        return ReportGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
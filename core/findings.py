@@ -0,0 +1,48 @@
+"""
+Finding Model Module
+Typed container for individual security findings.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, Optional
+
+
+@dataclass(slots=True)
+class Finding:
+    """A single security finding, with the defaults reports fall back to."""
+
+    type: str = 'Unknown'
+    severity: str = 'info'
+    title: str = 'Unknown'
+    description: str = 'No description'
+    details: Dict[str, Any] = field(default_factory=dict)
+    remediation: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Finding':
+        """
+        Build a finding from its dictionary form.
+
+        Args:
+            data: Finding dictionary as stored in scan history; unknown keys are ignored
+
+        Returns:
+            Finding instance with defaults for any missing fields
+        """
+        return cls(**{name: data[name] for name in _FIELD_NAMES if name in data})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form used in scan history and JSON reports."""
+        data = {
+            'type': self.type,
+            'severity': self.severity,
+            'title': self.title,
+            'description': self.description,
+            'details': self.details
+        }
+        if self.remediation is not None:
+            data['remediation'] = self.remediation
+        return data
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(Finding))
@@ -0,0 +1,22 @@
+"""
+PDF Worker Module
+Entry point for rendering PDF reports in worker processes.
+"""
+
+from .report_generator import ReportGenerator
+
+
+def render_pdf(scan_id: str) -> str:
+    """
+    Render the PDF report for a scan.
+    
+    Runs inside a PDF worker process, so it only touches the report module and
+    builds no web app or scanner state.
+    
+    Args:
+        scan_id: Scan identifier
+        
+    Returns:
+        Path to the generated PDF
+    """
+    return ReportGenerator.generate_report(scan_id, 'pdf')
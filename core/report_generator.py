@@ -5,95 +5,400 @@ Generates PDF and HTML reports from scan results.
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import (
+    BaseDocTemplate, Flowable, Frame, PageTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+)
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from collections import OrderedDict
 from datetime import datetime
-import json
+from functools import lru_cache
+from itertools import islice
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup, escape
+import orjson
 import os
-from typing import Dict, Any, List
+import re
+import threading
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .findings import Finding
+
+
+# PDF styles are pure data, so build them once at import rather than per report
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#1a237e'),
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    textColor=colors.HexColor('#283593'),
+    spaceAfter=12
+)
+
+# Report ordering: most severe first, unknown severities last
+_SEVERITY_RANK = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3, 'info': 4}
+
+# Display labels, precomputed so report loops do not call .upper() per finding
+_SEVERITY_LABELS = {severity: severity.upper() for severity in _SEVERITY_RANK}
+
+_SEVERITY_COLORS = {
+    'critical': colors.HexColor('#d32f2f'),
+    'high': colors.HexColor('#f57c00'),
+    'medium': colors.HexColor('#fbc02d'),
+    'low': colors.HexColor('#689f38'),
+    'info': colors.HexColor('#1976d2')
+}
+
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e8eaf6')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')])
+])
+
+# Fixed part of the risk table style; per-report highlights are layered on top
+_RISK_TABLE_BASE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+])
+
+
+def _minify_css(css: str) -> str:
+    """Collapse whitespace in a stylesheet so it adds fewer bytes to each report."""
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};:,])\s*', r'\1', css).strip() + '\n'
+
+
+# Stylesheet embedded in every HTML report, minified once at import. It stays
+# inline so a downloaded report renders on its own without a companion file.
+_HTML_REPORT_CSS = _minify_css("""\
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body { 
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
+    line-height: 1.6; 
+    color: #333;
+    background: #f5f5f5;
+}
+.container { max-width: 1200px; margin: 0 auto; padding: 20px; }
+.header { 
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+    color: white; 
+    padding: 40px; 
+    border-radius: 10px; 
+    margin-bottom: 30px;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+}
+.header h1 { font-size: 2.5em; margin-bottom: 10px; }
+.summary-grid { 
+    display: grid; 
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); 
+    gap: 20px; 
+    margin-bottom: 30px;
+}
+.summary-card { 
+    background: white; 
+    padding: 25px; 
+    border-radius: 10px; 
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    text-align: center;
+}
+.summary-card.critical { border-top: 4px solid #d32f2f; }
+.summary-card.high { border-top: 4px solid #f57c00; }
+.summary-card.medium { border-top: 4px solid #fbc02d; }
+.summary-card.low { border-top: 4px solid #689f38; }
+.summary-card.info { border-top: 4px solid #1976d2; }
+.count { font-size: 2.5em; font-weight: bold; margin: 10px 0; }
+.critical .count { color: #d32f2f; }
+.high .count { color: #f57c00; }
+.medium .count { color: #fbc02d; }
+.low .count { color: #689f38; }
+.info .count { color: #1976d2; }
+.findings-section { background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.finding { 
+    border-left: 4px solid #ddd; 
+    padding: 20px; 
+    margin-bottom: 20px; 
+    background: #fafafa;
+    border-radius: 0 5px 5px 0;
+}
+.finding.critical { border-left-color: #d32f2f; background: #ffebee; }
+.finding.high { border-left-color: #f57c00; background: #fff3e0; }
+.finding.medium { border-left-color: #fbc02d; background: #fffde7; }
+.finding.low { border-left-color: #689f38; background: #f1f8e9; }
+.finding.info { border-left-color: #1976d2; background: #e3f2fd; }
+.finding-header { 
+    display: flex; 
+    justify-content: space-between; 
+    align-items: center; 
+    margin-bottom: 10px;
+}
+.finding-title { font-size: 1.2em; font-weight: bold; }
+.severity-badge { 
+    padding: 5px 15px; 
+    border-radius: 20px; 
+    color: white; 
+    font-weight: bold;
+    text-transform: uppercase;
+    font-size: 0.8em;
+}
+.severity-badge.critical { background: #d32f2f; }
+.severity-badge.high { background: #f57c00; }
+.severity-badge.medium { background: #fbc02d; color: #333; }
+.severity-badge.low { background: #689f38; }
+.severity-badge.info { background: #1976d2; }
+.finding-description { margin: 10px 0; color: #555; }
+.finding-details { 
+    background: white; 
+    padding: 15px; 
+    border-radius: 5px; 
+    margin-top: 10px;
+    font-family: monospace;
+    font-size: 0.9em;
+}
+.remediation { 
+    background: #e8f5e9; 
+    padding: 15px; 
+    border-radius: 5px; 
+    margin-top: 10px;
+    border-left: 3px solid #4caf50;
+}
+.metadata { 
+    display: grid; 
+    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); 
+    gap: 15px; 
+    margin-top: 30px;
+    background: white;
+    padding: 20px;
+    border-radius: 10px;
+}
+.metadata-item { display: flex; justify-content: space-between; }
+.metadata-label { font-weight: bold; color: #666; }
+""")
+
+
+def _format_detail_value(value: Any) -> Any:
+    """Render nested detail values as truncated JSON for the reports."""
+    if isinstance(value, (list, dict)):
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()[:200]
+    return value
+
+
+# HTML report template, compiled once at import. Autoescaping keeps finding
+# content (payloads, page snippets) from being interpreted as markup.
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), 'templates')),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+_JINJA_ENV.filters['detail_value'] = _format_detail_value
+_JINJA_ENV.globals['report_css'] = Markup(_HTML_REPORT_CSS)
+_JINJA_ENV.globals['severity_labels'] = _SEVERITY_LABELS
+_HTML_TEMPLATE = _JINJA_ENV.get_template('report.html')
+
+# Output directory for generated reports. Created once here (app.py also creates
+# it at startup) rather than with a makedirs call on every report.
+REPORTS_DIR = 'reports'
+os.makedirs(REPORTS_DIR, exist_ok=True)
+
+# Generated report paths keyed by (scan_id, format, source file, source mtime), so
+# repeat downloads of an unchanged scan reuse the file already on disk
+_REPORT_PATHS: 'OrderedDict[Tuple[str, str, str, float], str]' = OrderedDict()
+_REPORT_PATHS_MAX = 64
+# Request threads share the cache; the lock covers lookups and updates, not rendering
+_REPORT_PATHS_LOCK = threading.Lock()
+
+
+class _StreamingDocTemplate(BaseDocTemplate):
+    """Single-frame document template that pulls flowables lazily from an iterable."""
+    
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, **kwargs)
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+        self.addPageTemplates([PageTemplate(id='Report', frames=frame, pagesize=self.pagesize)])
+    
+    def build_from_iter(self, flowables: Iterable[Flowable], lookahead: int = 8):
+        """
+        Build the document, holding only a small window of flowables at a time.
+        
+        Args:
+            flowables: Iterable (typically a generator) of flowables in document order
+            lookahead: Number of pending flowables kept buffered for splitting and keep-with-next
+        """
+        source = iter(flowables)
+        pending = []
+        
+        self._startBuild()
+        canv = self.canv
+        try:
+            canv._doctemplate = self
+            while True:
+                # Top up the window; handle_flowable consumes from the front and
+                # pushes split remainders back onto it
+                pending.extend(islice(source, lookahead - len(pending)))
+                if not pending:
+                    break
+                self.clean_hanging()
+                self.handle_flowable(pending)
+        finally:
+            del canv._doctemplate
+        
+        self._endBuild()
 
 
 class ReportGenerator:
     """Generate security scan reports in various formats."""
     
     @staticmethod
-    def generate_report(scan_id: str, format_type: str = 'pdf') -> str:
+    def generate_report(scan_id: str, format_type: str = 'pdf',
+                        pdf_renderer: Optional[Callable[[str], str]] = None) -> str:
         """
         Generate report for a scan.
         
         Args:
             scan_id: Scan identifier
             format_type: Report format (pdf, html, json)
+            pdf_renderer: Optional callable that renders the PDF for a scan ID
+                elsewhere, e.g. in a worker process, and returns its path; the
+                result is cached here just like a PDF rendered in this process
             
         Returns:
             Path to generated report file
         """
         # Load scan results from history
-        scan_data = ReportGenerator._load_scan_data(scan_id)
+        source = ReportGenerator._scan_source(scan_id)
+        loaded = ReportGenerator._load_scan_data_cached(scan_id, *source) if source else None
         
-        if not scan_data:
+        if not loaded:
             raise ValueError(f"Scan {scan_id} not found")
-        
-        if format_type == 'pdf':
-            return ReportGenerator._generate_pdf(scan_data)
+        raw_scan, scan_data = loaded
+        
+        # Completed scans do not change, so an earlier report of the same file
+        # version is still accurate unless it has been deleted from disk
+        cache_key = (scan_id, format_type, *source)
+        with _REPORT_PATHS_LOCK:
+            report_path = _REPORT_PATHS.get(cache_key)
+        if report_path and os.path.exists(report_path):
+            return report_path
+        
+        if format_type == 'pdf' and pdf_renderer is not None:
+            report_path = pdf_renderer(scan_id)
+        elif format_type == 'pdf':
+            report_path = ReportGenerator._generate_pdf(scan_data)
         elif format_type == 'html':
-            return ReportGenerator._generate_html(scan_data)
+            report_path = ReportGenerator._generate_html(scan_data)
         elif format_type == 'json':
-            return ReportGenerator._generate_json(scan_data)
+            report_path = ReportGenerator._generate_json(raw_scan)
         else:
             raise ValueError(f"Unsupported format: {format_type}")
+        
+        with _REPORT_PATHS_LOCK:
+            _REPORT_PATHS[cache_key] = report_path
+            _REPORT_PATHS.move_to_end(cache_key)
+            if len(_REPORT_PATHS) > _REPORT_PATHS_MAX:
+                _REPORT_PATHS.popitem(last=False)
+        return report_path
+    
+    @staticmethod
+    def _scan_source(scan_id: str) -> Optional[Tuple[str, float]]:
+        """
+        Locate the file holding a scan's data.
+        
+        Args:
+            scan_id: Scan identifier
+            
+        Returns:
+            (path, mtime) of the per-scan file, falling back to the history file,
+            or None if the scan ID is invalid or no file exists
+        """
+        # Scan IDs are used as file names, so reject anything that is not a bare name
+        if not scan_id or os.path.basename(scan_id) != scan_id:
+            return None
+        
+        scan_file = os.path.join('logs', 'scans', f'{scan_id}.json')
+        # Scans saved before per-scan files existed only live in the legacy history array
+        source = scan_file if os.path.exists(scan_file) else os.path.join('logs', 'scan_history.json')
+        
+        try:
+            mtime = os.path.getmtime(source)
+        except OSError:
+            return None
+        
+        # Keying caches on mtime means a rewritten file is re-read instead of served stale
+        return source, mtime
     
     @staticmethod
-    def _load_scan_data(scan_id: str) -> Dict[str, Any]:
-        """Load scan data from history file."""
+    @lru_cache(maxsize=128)
+    def _load_scan_data_cached(scan_id: str, source: str, mtime: float) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Parse scan data from a per-scan or history file; cached per file version.
+        
+        Returns:
+            (raw, prepared) scan data: the record exactly as saved, and a copy with
+            normalized findings (see _prepare_findings), or None if not found
+        """
         try:
-            history_file = os.path.join('logs', 'scan_history.json')
-            if os.path.exists(history_file):
-                with open(history_file, 'r') as f:
-                    history = json.load(f)
-                    for scan in history:
-                        if scan['scan_id'] == scan_id:
-                            return scan
+            with open(source, 'rb') as f:
+                data = orjson.loads(f.read())
+            
+            if isinstance(data, dict):
+                return data, ReportGenerator._prepare_findings(data)
+            
+            for scan in data:
+                if scan['scan_id'] == scan_id:
+                    return scan, ReportGenerator._prepare_findings(scan)
         except Exception:
             pass
         return None
     
+    @staticmethod
+    def _prepare_findings(scan_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize findings once per load so the PDF and HTML reports can reuse them.
+        
+        Findings become Finding objects with display defaults filled in, sorted by
+        severity; the input record is left untouched for the JSON export.
+        """
+        findings = [Finding.from_dict(f) for f in scan_data.get('findings', [])]
+        findings.sort(key=lambda f: _SEVERITY_RANK.get(f.severity, 4))
+        return {**scan_data, 'findings': findings}
+    
     @staticmethod
     def _generate_pdf(scan_data: Dict[str, Any]) -> str:
         """Generate PDF report."""
-        report_path = os.path.join('reports', f"scan_{scan_data['scan_id'][:8]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
-        os.makedirs('reports', exist_ok=True)
-        
-        doc = SimpleDocTemplate(report_path, pagesize=A4)
-        elements = []
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a237e'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#283593'),
-            spaceAfter=12
-        )
+        report_path = os.path.join(REPORTS_DIR, f"scan_{scan_data['scan_id'][:8]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
         
+        doc = _StreamingDocTemplate(report_path, pagesize=A4)
+        doc.build_from_iter(ReportGenerator._pdf_flowables(scan_data))
+        return report_path
+    
+    @staticmethod
+    def _pdf_flowables(scan_data: Dict[str, Any]) -> Iterator[Flowable]:
+        """Yield the PDF report flowables in document order."""
         # Title
-        elements.append(Paragraph("Web Application Security Report", title_style))
-        elements.append(Spacer(1, 0.2*inch))
+        yield Paragraph("Web Application Security Report", _TITLE_STYLE)
+        yield Spacer(1, 0.2*inch)
         
         # Executive Summary
-        elements.append(Paragraph("Executive Summary", heading_style))
+        yield Paragraph("Executive Summary", _HEADING_STYLE)
         
         summary_data = [
             ['Target URL', scan_data.get('target_url', 'N/A')],
@@ -104,21 +409,13 @@ class ReportGenerator:
         ]
         
         summary_table = Table(summary_data, colWidths=[2*inch, 4*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e8eaf6')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')])
-        ]))
-        
-        elements.append(summary_table)
-        elements.append(Spacer(1, 0.3*inch))
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
+        
+        yield summary_table
+        yield Spacer(1, 0.3*inch)
         
         # Risk Summary
-        elements.append(Paragraph("Risk Summary", heading_style))
+        yield Paragraph("Risk Summary", _HEADING_STYLE)
         
         stats = scan_data.get('stats', {})
         risk_data = [
@@ -131,292 +428,85 @@ class ReportGenerator:
         
         risk_table = Table(risk_data, colWidths=[1.2*inch, 1*inch, 3.8*inch])
         risk_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-            ('TEXTCOLOR', (0, 0), (0, 0), colors.HexColor('#d32f2f') if stats.get('critical', 0) > 0 else colors.black),
-            ('TEXTCOLOR', (0, 1), (0, 1), colors.HexColor('#f57c00') if stats.get('high', 0) > 0 else colors.black),
-            ('TEXTCOLOR', (0, 2), (0, 2), colors.HexColor('#fbc02d') if stats.get('medium', 0) > 0 else colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+            # Highlight only the severities that actually have findings
+            ('TEXTCOLOR', (0, 0), (0, 0), _SEVERITY_COLORS['critical'] if stats.get('critical', 0) > 0 else colors.black),
+            ('TEXTCOLOR', (0, 1), (0, 1), _SEVERITY_COLORS['high'] if stats.get('high', 0) > 0 else colors.black),
+            ('TEXTCOLOR', (0, 2), (0, 2), _SEVERITY_COLORS['medium'] if stats.get('medium', 0) > 0 else colors.black),
             ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#ffebee') if stats.get('critical', 0) > 0 else colors.white),
             ('BACKGROUND', (0, 1), (0, 1), colors.HexColor('#fff3e0') if stats.get('high', 0) > 0 else colors.white),
-        ]))
+        ], parent=_RISK_TABLE_BASE_STYLE))
         
-        elements.append(risk_table)
-        elements.append(Spacer(1, 0.3*inch))
+        yield risk_table
+        yield Spacer(1, 0.3*inch)
         
         # Detailed Findings
-        elements.append(PageBreak())
-        elements.append(Paragraph("Detailed Findings", heading_style))
-        elements.append(Spacer(1, 0.2*inch))
+        yield PageBreak()
+        yield Paragraph("Detailed Findings", _HEADING_STYLE)
+        yield Spacer(1, 0.2*inch)
         
+        # Findings are already in severity order and normalized (see _prepare_findings)
         findings = scan_data.get('findings', [])
         
-        severity_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3, 'info': 4}
-        sorted_findings = sorted(findings, key=lambda x: severity_order.get(x.get('severity', 'info'), 4))
-        
-        for i, finding in enumerate(sorted_findings[:50], 1):  # Limit to 50 findings
-            severity = finding.get('severity', 'info')
-            severity_colors = {
-                'critical': colors.HexColor('#d32f2f'),
-                'high': colors.HexColor('#f57c00'),
-                'medium': colors.HexColor('#fbc02d'),
-                'low': colors.HexColor('#689f38'),
-                'info': colors.HexColor('#1976d2')
-            }
-            
-            # Finding header
-            finding_header = f"<b>{i}. [{severity.upper()}] {finding.get('title', 'Unknown')}</b>"
-            elements.append(Paragraph(finding_header, styles['Heading3']))
-            
-            # Finding details
-            finding_text = f"""
-            <b>Type:</b> {finding.get('type', 'Unknown')}<br/>
-            <b>Description:</b> {finding.get('description', 'No description')}<br/>
-            """
-            
-            details = finding.get('details', {})
-            if details:
-                finding_text += "<b>Details:</b><br/>"
-                for key, value in details.items():
-                    if isinstance(value, (list, dict)):
-                        value = json.dumps(value, indent=2)[:200]
-                    finding_text += f"&nbsp;&nbsp;• {key}: {value}<br/>"
-            
-            if 'remediation' in finding:
-                finding_text += f"<b>Remediation:</b> {finding['remediation']}<br/>"
-            
-            elements.append(Paragraph(finding_text, styles['Normal']))
-            elements.append(Spacer(1, 0.2*inch))
+        for i, finding in enumerate(findings[:50], 1):  # Limit to 50 findings
+            finding_header, finding_text = ReportGenerator._finding_markup(i, finding)
+            yield Paragraph(finding_header, _STYLES['Heading3'])
+            yield Paragraph(finding_text, _STYLES['Normal'])
+            yield Spacer(1, 0.2*inch)
+    
+    @staticmethod
+    def _finding_markup(index: int, finding: Finding) -> Tuple[str, str]:
+        """Build the paragraph markup for one PDF finding as (header, body)."""
+        severity = finding.severity
+        
+        # Finding content is untrusted (payloads, page snippets), so escape it
+        # before it reaches ReportLab's paragraph markup parser
+        label = _SEVERITY_LABELS.get(severity) or escape(severity.upper())
+        finding_header = f"<b>{index}. [{label}] {escape(finding.title)}</b>"
+        
+        parts = [
+            f"<b>Type:</b> {escape(finding.type)}<br/>",
+            f"<b>Description:</b> {escape(finding.description)}<br/>"
+        ]
         
-        # Build PDF
-        doc.build(elements)
-        return report_path
+        details = finding.details
+        if details:
+            parts.append("<b>Details:</b><br/>")
+            parts.extend(
+                f"&nbsp;&nbsp;• {escape(key)}: {escape(_format_detail_value(value))}<br/>"
+                for key, value in details.items()
+            )
+        
+        if finding.remediation is not None:
+            parts.append(f"<b>Remediation:</b> {escape(finding.remediation)}<br/>")
+        
+        return finding_header, ''.join(parts)
     
     @staticmethod
     def _generate_html(scan_data: Dict[str, Any]) -> str:
         """Generate HTML report."""
-        report_path = os.path.join('reports', f"scan_{scan_data['scan_id'][:8]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
-        os.makedirs('reports', exist_ok=True)
+        report_path = os.path.join(REPORTS_DIR, f"scan_{scan_data['scan_id'][:8]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
         
         stats = scan_data.get('stats', {})
+        # Findings are already in severity order and normalized (see _prepare_findings)
         findings = scan_data.get('findings', [])
         
-        severity_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3, 'info': 4}
-        sorted_findings = sorted(findings, key=lambda x: severity_order.get(x.get('severity', 'info'), 4))
-        
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Security Scan Report - {scan_data.get('target_url', 'Unknown')}</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            line-height: 1.6; 
-            color: #333;
-            background: #f5f5f5;
-        }}
-        .container {{ max-width: 1200px; margin: 0 auto; padding: 20px; }}
-        .header {{ 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-            color: white; 
-            padding: 40px; 
-            border-radius: 10px; 
-            margin-bottom: 30px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .header h1 {{ font-size: 2.5em; margin-bottom: 10px; }}
-        .summary-grid {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); 
-            gap: 20px; 
-            margin-bottom: 30px;
-        }}
-        .summary-card {{ 
-            background: white; 
-            padding: 25px; 
-            border-radius: 10px; 
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-        }}
-        .summary-card.critical {{ border-top: 4px solid #d32f2f; }}
-        .summary-card.high {{ border-top: 4px solid #f57c00; }}
-        .summary-card.medium {{ border-top: 4px solid #fbc02d; }}
-        .summary-card.low {{ border-top: 4px solid #689f38; }}
-        .summary-card.info {{ border-top: 4px solid #1976d2; }}
-        .count {{ font-size: 2.5em; font-weight: bold; margin: 10px 0; }}
-        .critical .count {{ color: #d32f2f; }}
-        .high .count {{ color: #f57c00; }}
-        .medium .count {{ color: #fbc02d; }}
-        .low .count {{ color: #689f38; }}
-        .info .count {{ color: #1976d2; }}
-        .findings-section {{ background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .finding {{ 
-            border-left: 4px solid #ddd; 
-            padding: 20px; 
-            margin-bottom: 20px; 
-            background: #fafafa;
-            border-radius: 0 5px 5px 0;
-        }}
-        .finding.critical {{ border-left-color: #d32f2f; background: #ffebee; }}
-        .finding.high {{ border-left-color: #f57c00; background: #fff3e0; }}
-        .finding.medium {{ border-left-color: #fbc02d; background: #fffde7; }}
-        .finding.low {{ border-left-color: #689f38; background: #f1f8e9; }}
-        .finding.info {{ border-left-color: #1976d2; background: #e3f2fd; }}
-        .finding-header {{ 
-            display: flex; 
-            justify-content: space-between; 
-            align-items: center; 
-            margin-bottom: 10px;
-        }}
-        .finding-title {{ font-size: 1.2em; font-weight: bold; }}
-        .severity-badge {{ 
-            padding: 5px 15px; 
-            border-radius: 20px; 
-            color: white; 
-            font-weight: bold;
-            text-transform: uppercase;
-            font-size: 0.8em;
-        }}
-        .severity-badge.critical {{ background: #d32f2f; }}
-        .severity-badge.high {{ background: #f57c00; }}
-        .severity-badge.medium {{ background: #fbc02d; color: #333; }}
-        .severity-badge.low {{ background: #689f38; }}
-        .severity-badge.info {{ background: #1976d2; }}
-        .finding-description {{ margin: 10px 0; color: #555; }}
-        .finding-details {{ 
-            background: white; 
-            padding: 15px; 
-            border-radius: 5px; 
-            margin-top: 10px;
-            font-family: monospace;
-            font-size: 0.9em;
-        }}
-        .remediation {{ 
-            background: #e8f5e9; 
-            padding: 15px; 
-            border-radius: 5px; 
-            margin-top: 10px;
-            border-left: 3px solid #4caf50;
-        }}
-        .metadata {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); 
-            gap: 15px; 
-            margin-top: 30px;
-            background: white;
-            padding: 20px;
-            border-radius: 10px;
-        }}
-        .metadata-item {{ display: flex; justify-content: space-between; }}
-        .metadata-label {{ font-weight: bold; color: #666; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Web Application Security Report</h1>
-            <p>Target: {scan_data.get('target_url', 'Unknown')}</p>
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-        
-        <div class="summary-grid">
-            <div class="summary-card critical">
-                <div class="label">Critical</div>
-                <div class="count">{stats.get('critical', 0)}</div>
-            </div>
-            <div class="summary-card high">
-                <div class="label">High</div>
-                <div class="count">{stats.get('high', 0)}</div>
-            </div>
-            <div class="summary-card medium">
-                <div class="label">Medium</div>
-                <div class="count">{stats.get('medium', 0)}</div>
-            </div>
-            <div class="summary-card low">
-                <div class="label">Low</div>
-                <div class="count">{stats.get('low', 0)}</div>
-            </div>
-        </div>
-        
-        <div class="findings-section">
-            <h2>Detailed Findings ({len(findings)} total)</h2>
-"""
-        
-        for finding in sorted_findings:
-            severity = finding.get('severity', 'info')
-            html_content += f"""
-            <div class="finding {severity}">
-                <div class="finding-header">
-                    <div class="finding-title">{finding.get('title', 'Unknown')}</div>
-                    <span class="severity-badge {severity}">{severity.upper()}</span>
-                </div>
-                <div class="finding-description">{finding.get('description', 'No description')}</div>
-                <div class="finding-details">
-                    <strong>Type:</strong> {finding.get('type', 'Unknown')}<br>
-"""
-            
-            details = finding.get('details', {})
-            for key, value in details.items():
-                if isinstance(value, (list, dict)):
-                    value = json.dumps(value, indent=2)[:200]
-                html_content += f"<strong>{key}:</strong> {value}<br>"
-            
-            html_content += "</div>"
-            
-            if 'remediation' in finding:
-                html_content += f"""
-                <div class="remediation">
-                    <strong>Remediation:</strong> {finding['remediation']}
-                </div>
-"""
-            
-            html_content += "</div>"
-        
-        html_content += f"""
-        </div>
-        
-        <div class="metadata">
-            <div class="metadata-item">
-                <span class="metadata-label">Scan ID:</span>
-                <span>{scan_data['scan_id']}</span>
-            </div>
-            <div class="metadata-item">
-                <span class="metadata-label">Status:</span>
-                <span>{scan_data.get('status', 'Unknown')}</span>
-            </div>
-            <div class="metadata-item">
-                <span class="metadata-label">Start Time:</span>
-                <span>{scan_data.get('start_time', 'N/A')}</span>
-            </div>
-            <div class="metadata-item">
-                <span class="metadata-label">End Time:</span>
-                <span>{scan_data.get('end_time', 'N/A')}</span>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-"""
-        
+        # Stream the pre-compiled template straight into the file
         with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.writelines(_HTML_TEMPLATE.generate(
+                scan_data=scan_data,
+                stats=stats,
+                findings=findings,
+                generated=datetime.now()
+            ))
         
         return report_path
     
     @staticmethod
     def _generate_json(scan_data: Dict[str, Any]) -> str:
-        """Generate JSON report."""
-        report_path = os.path.join('reports', f"scan_{scan_data['scan_id'][:8]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-        os.makedirs('reports', exist_ok=True)
+        """Generate JSON report from the scan record exactly as it was saved."""
+        report_path = os.path.join(REPORTS_DIR, f"scan_{scan_data['scan_id'][:8]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
         
-        with open(report_path, 'w') as f:
-            json.dump(scan_data, f, indent=2)
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(scan_data, option=orjson.OPT_INDENT_2))
         
         return report_path
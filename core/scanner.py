@@ -4,18 +4,24 @@ Integrates Requests, Selenium, and Burp Suite for comprehensive security testing
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import uuid
-import json
+import orjson
 import os
+import time
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-from typing import Dict, List, Any, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
 import threading
 import queue
+from collections import Counter, deque
+from itertools import islice
 
 from .vulnerability_scanner import VulnerabilityScanner
 from .burp_integration import BurpIntegration
+from .findings import Finding
 
 try:
     from .selenium_scanner import SeleniumScanner
@@ -24,20 +30,108 @@ except ImportError:
     SELENIUM_AVAILABLE = False
     SeleniumScanner = None
 
+# Security headers checked during recon: (header, severity when missing, description)
+_SECURITY_HEADERS = (
+    ('Strict-Transport-Security', 'medium',
+     'HSTS header missing - site vulnerable to SSL stripping attacks'),
+    ('Content-Security-Policy', 'medium',
+     'CSP header missing - increases XSS attack surface'),
+    ('X-Frame-Options', 'medium',
+     'X-Frame-Options missing - site may be vulnerable to clickjacking'),
+    ('X-Content-Type-Options', 'low',
+     'X-Content-Type-Options missing - browser may MIME-sniff content'),
+    ('Referrer-Policy', 'low',
+     'Referrer-Policy missing - referrer information may leak'),
+    ('Permissions-Policy', 'info',
+     'Permissions-Policy missing - browser features not restricted'),
+)
+
+# Scans keep epoch timestamps internally; these become ISO strings when a scan
+# leaves the scanner through the API or is written to disk
+_TIMESTAMP_FIELDS = (
+    ('start_time_ts', 'start_time'),
+    ('last_update_ts', 'last_update'),
+    ('end_time_ts', 'end_time'),
+)
+
+# Most of the recon response body that is downloaded and parsed
+_RECON_MAX_BODY = 2 * 1024 * 1024
+
 
 class SecurityScanner:
     """Main security scanner class that orchestrates all scanning modules."""
     
-    def __init__(self):
+    def __init__(self, max_concurrent_scans: int = 4):
+        """
+        Initialize the scanner.
+        
+        Args:
+            max_concurrent_scans: Number of scans allowed to run at once; extra scans are queued
+        """
         self.active_scans = {}
-        self.scan_history = []
+        # Serialized records of completed scans, oldest first; capped so a
+        # long-running server stays bounded
+        self.scan_history = deque(maxlen=1000)
         self.results_queue = queue.Queue()
-        self.vuln_scanner = VulnerabilityScanner()
-        self.selenium_scanner = SeleniumScanner() if SELENIUM_AVAILABLE else None
+        self.session = self._create_session()
+        self.vuln_scanner = VulnerabilityScanner(session=self.session)
         self.burp_integration = BurpIntegration()
+        # Guards active_scans, scan_history and the scan dicts they hold, which
+        # scan workers update while API requests read them
+        self._lock = threading.Lock()
+        # Each scan runs on its own daemon thread, as before the pool, so an
+        # interrupted server exits without waiting for scans; the semaphore
+        # bounds how many run at once and the rest wait in the 'queued' state
+        self._scan_slots = threading.BoundedSemaphore(max_concurrent_scans)
+        self._closed = threading.Event()
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create the base session whose pooled adapter every scan shares."""
+        session = requests.Session()
+        session.verify = False
+        session.headers.update({
+            'User-Agent': 'WebSecTester/1.0 Security Scanner'
+        })
+        
+        # Retry connection failures only; retrying read timeouts would skew
+        # time-based SQL injection checks
+        retries = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _scan_session(self) -> requests.Session:
+        """
+        Create a session for a single scan.
+        
+        It mounts the base session's adapter, so connections are still pooled
+        across scans, but has its own cookie jar so cookies set by one target
+        never reach another scan. It must not be closed: closing a session
+        closes its adapters, which are shared.
+        
+        Returns:
+            Session with fresh cookies and the shared connection pool
+        """
+        session = requests.Session()
+        session.verify = self.session.verify
+        session.headers.update(self.session.headers)
+        for prefix, adapter in self.session.adapters.items():
+            session.mount(prefix, adapter)
+        return session
+    
+    def close(self):
+        """Stop accepting scans, drop queued ones and release pooled HTTP connections."""
+        # Queued scans see the flag when they get a slot and end without running;
+        # scan threads are daemons, so at process exit running ones end with the interpreter
+        self._closed.set()
+        self.session.close()
+        self.burp_integration.close()
         
     def scan(self, target_url: str, scan_types: List[str], 
-             use_burp: bool = False, use_selenium: bool = True) -> Dict[str, Any]:
+             use_burp: bool = False, use_selenium: bool = True,
+             parallel: bool = True) -> Dict[str, Any]:
         """
         Start a comprehensive security scan.
         
@@ -46,18 +140,24 @@ class SecurityScanner:
             scan_types: List of scan types to perform
             use_burp: Whether to use Burp Suite proxy
             use_selenium: Whether to use Selenium browser automation
+            parallel: Whether scan phases run concurrently; False runs them one
+                at a time, e.g. for targets that throttle concurrent clients
             
         Returns:
             Scan results dictionary
         """
+        if self._closed.is_set():
+            raise RuntimeError('Scanner has been shut down')
+        
         scan_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
         
         scan_info = {
             'scan_id': scan_id,
             'target_url': target_url,
-            'status': 'running',
-            'start_time': timestamp,
+            'status': 'queued',
+            'current_message': 'Waiting for a free scan worker...',
+            'progress': 0,
+            'start_time_ts': time.time(),
             'scan_types': scan_types,
             'findings': [],
             'stats': {
@@ -70,231 +170,439 @@ class SecurityScanner:
             }
         }
         
-        self.active_scans[scan_id] = scan_info
+        with self._lock:
+            self.active_scans[scan_id] = scan_info
         
-        # Start scan in background thread
+        # Run the scan in the background once a slot is free; the caller polls get_scan_status()
         scan_thread = threading.Thread(
-            target=self._run_scan,
-            args=(scan_id, target_url, scan_types, use_burp, use_selenium)
+            target=self._run_queued_scan,
+            args=(scan_id, target_url, scan_types, use_burp, use_selenium, parallel),
+            name=f'scan-{scan_id[:8]}',
+            daemon=True
         )
-        scan_thread.daemon = True
         scan_thread.start()
         
-        return {'scan_id': scan_id, 'status': 'started', 'message': 'Scan initiated successfully'}
+        return {'scan_id': scan_id, 'status': 'queued', 'message': 'Scan queued successfully'}
+    
+    def _run_queued_scan(self, *args):
+        """Wait for a free scan slot, then run the scan."""
+        with self._scan_slots:
+            if self._closed.is_set():
+                scan_id = args[0]
+                with self._lock:
+                    scan_info = self.active_scans.get(scan_id)
+                if scan_info is not None:
+                    self._fail_scan(scan_info, 'Scanner was shut down before the scan started')
+                return
+            self._run_scan(*args)
     
     def _run_scan(self, scan_id: str, target_url: str, scan_types: List[str],
-                  use_burp: bool, use_selenium: bool):
+                  use_burp: bool, use_selenium: bool, parallel: bool = True):
         """Execute the actual scanning logic."""
         try:
-            scan_info = self.active_scans[scan_id]
+            with self._lock:
+                scan_info = self.active_scans[scan_id]
             all_findings = []
+            self._update_status(scan_id, 'running', 'Starting scan...')
             
             # Configure proxy if Burp is enabled
             proxies = None
             if use_burp:
                 proxies = self.burp_integration.get_proxy_config()
             
-            # 1. Basic reconnaissance with Requests
+            # Phases are independent and I/O-bound, so by default they run side by side
+            tasks = []
+            session = self._scan_session()
+            
+            # 1. Basic reconnaissance with Requests; a headers-only scan skips the body
             if 'recon' in scan_types or 'all' in scan_types:
-                self._update_status(scan_id, 'running', 'Performing reconnaissance...')
-                recon_results = self._perform_recon(target_url, proxies)
-                all_findings.extend(recon_results)
+                tasks.append(('reconnaissance', lambda: self._perform_recon(target_url, proxies, session)))
+            elif 'headers' in scan_types:
+                tasks.append(('header check', lambda: self._recon_lite(target_url, proxies, session)))
             
             # 2. Vulnerability scanning with Requests
             if 'vulnerabilities' in scan_types or 'all' in scan_types:
-                self._update_status(scan_id, 'running', 'Scanning for vulnerabilities...')
-                vuln_results = self.vuln_scanner.scan(target_url, proxies)
-                all_findings.extend(vuln_results)
+                vuln_scanner = VulnerabilityScanner(session=session)
+                tasks.append(('vulnerability scan', lambda: vuln_scanner.scan(target_url, proxies)))
             
-            # 3. Browser-based testing with Selenium
+            # 3. Browser-based testing with Selenium; each scan gets its own
+            # scanner because it holds the WebDriver on the instance
             if use_selenium and SELENIUM_AVAILABLE and ('browser' in scan_types or 'all' in scan_types):
-                self._update_status(scan_id, 'running', 'Running browser automation tests...')
-                browser_results = self.selenium_scanner.scan(target_url)
-                all_findings.extend(browser_results)
+                tasks.append(('browser automation', lambda: SeleniumScanner().scan(target_url)))
             
             # 4. Burp Suite analysis (if enabled)
             if use_burp and ('burp' in scan_types or 'all' in scan_types):
-                self._update_status(scan_id, 'running', 'Analyzing through Burp Suite...')
-                burp_results = self.burp_integration.analyze(scan_id)
-                all_findings.extend(burp_results)
+                tasks.append(('Burp Suite analysis', lambda: self.burp_integration.analyze(scan_id)))
+            
+            if tasks:
+                self._update_status(
+                    scan_id, 'running',
+                    f"Running {', '.join(name for name, _ in tasks)}..."
+                )
+                
+                phase_results = {}
+                for name, result in self._run_phases(tasks, parallel):
+                    phase_results[name] = result
+                    self._update_status(
+                        scan_id, 'running',
+                        f'Finished {name} ({len(phase_results)}/{len(tasks)} phases)',
+                        progress=100 * len(phase_results) // len(tasks)
+                    )
+                
+                # Join in phase order so reports stay stable regardless of which finished first
+                for name, _ in tasks:
+                    all_findings.extend(phase_results[name])
             
             # Calculate statistics
             stats = self._calculate_stats(all_findings)
             
-            # Update final results
-            scan_info['findings'] = all_findings
-            scan_info['stats'] = stats
-            scan_info['status'] = 'completed'
-            scan_info['end_time'] = datetime.now().isoformat()
+            # Update final results and move the scan from active to history. A
+            # completed scan never changes again, so it is serialized once here and
+            # history reads hand out that record instead of rebuilding it
+            with self._lock:
+                scan_info['findings'] = all_findings
+                scan_info['stats'] = stats
+                scan_info['status'] = 'completed'
+                scan_info['progress'] = 100
+                scan_info['end_time_ts'] = time.time()
+                record = self._serialize_scan(scan_info)
+                self.active_scans.pop(scan_id, None)
+                self.scan_history.append(record)
             
-            # Save to history
-            self.scan_history.append(scan_info)
-            self._save_scan_history()
+            # Save to history; both files share the same record
+            self._save_scan_history(record)
+            self._save_scan_record(record)
             
         except Exception as e:
+            self._fail_scan(scan_info, str(e))
+    
+    def _fail_scan(self, scan_info: Dict[str, Any], error: str):
+        """
+        Mark a scan as failed and move it from active scans to history.
+        
+        Args:
+            scan_info: The scan's entry in active_scans
+            error: Error message reported for the scan
+        """
+        # Failed scans move to the capped history too, so failing targets
+        # cannot grow active_scans without bound
+        with self._lock:
             scan_info['status'] = 'error'
-            scan_info['error'] = str(e)
-            scan_info['end_time'] = datetime.now().isoformat()
+            scan_info['error'] = error
+            scan_info['end_time_ts'] = time.time()
+            if self.active_scans.pop(scan_info['scan_id'], None) is not None:
+                self.scan_history.append(self._serialize_scan(scan_info))
     
-    def _perform_recon(self, target_url: str, proxies: Optional[Dict]) -> List[Dict]:
-        """Perform basic reconnaissance on the target."""
+    @staticmethod
+    def _run_phases(tasks: List[Tuple[str, Callable[[], List[Finding]]]],
+                    parallel: bool) -> Iterator[Tuple[str, List[Finding]]]:
+        """
+        Run scan phases and yield their findings as each one finishes.
+        
+        Args:
+            tasks: (name, function) pairs; each function returns that phase's findings
+            parallel: Whether to run every phase on its own thread at once
+            
+        Yields:
+            (name, findings) tuples in completion order; a failed phase re-raises its error
+        """
+        if not parallel:
+            for name, fn in tasks:
+                yield name, fn()
+            return
+        
+        # Daemon threads rather than an executor, whose workers the interpreter
+        # joins at exit, so an interrupted server does not wait on browser phases
+        done = queue.Queue()
+        
+        def run(name, fn):
+            try:
+                done.put((name, fn(), None))
+            except BaseException as e:
+                done.put((name, None, e))
+        
+        for name, fn in tasks:
+            threading.Thread(target=run, args=(name, fn), name=f'scan-phase-{name}', daemon=True).start()
+        
+        for _ in tasks:
+            name, result, error = done.get()
+            if error is not None:
+                raise error
+            yield name, result
+    
+    def _perform_recon(self, target_url: str, proxies: Optional[Dict],
+                       session: Optional[requests.Session] = None) -> List[Finding]:
+        """Perform basic reconnaissance on the target, using the scan's session if given."""
         findings = []
+        session = session or self.session
         
         try:
-            # Basic request to check if target is alive
-            response = requests.get(
+            # Basic request to check if target is alive; stream the body so a
+            # huge or endless page is capped instead of loaded into memory
+            response = session.get(
                 target_url, 
                 proxies=proxies, 
                 timeout=30,
                 verify=False,
-                headers={
-                    'User-Agent': 'WebSecTester/1.0 Security Scanner'
-                }
+                stream=True
             )
+            # Read through iter_content so a fully drained body marks the response
+            # consumed and close() hands the connection back to the pool; only a
+            # capped body leaves unread bytes and closes the socket
+            chunks = []
+            size = 0
+            try:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size > _RECON_MAX_BODY:
+                        break
+            finally:
+                response.close()
             
-            findings.append({
-                'type': 'info',
-                'severity': 'info',
-                'title': 'Target Response',
-                'description': f'Target responded with status code {response.status_code}',
-                'details': {
-                    'status_code': response.status_code,
-                    'content_length': len(response.content),
-                    'response_time': response.elapsed.total_seconds(),
-                    'server': response.headers.get('Server', 'Unknown'),
-                    'content_type': response.headers.get('Content-Type', 'Unknown')
-                }
-            })
+            truncated = size > _RECON_MAX_BODY
+            body = b''.join(chunks)[:_RECON_MAX_BODY]
+            
+            details = {
+                'status_code': response.status_code,
+                'content_length': len(body),
+                'response_time': response.elapsed.total_seconds(),
+                'server': response.headers.get('Server', 'Unknown'),
+                'content_type': response.headers.get('Content-Type', 'Unknown')
+            }
+            if truncated:
+                details['body_truncated'] = True
+            
+            findings.append(Finding(
+                type='info',
+                severity='info',
+                title='Target Response',
+                description=f'Target responded with status code {response.status_code}',
+                details=details
+            ))
             
             # Check for security headers
             security_headers = self._check_security_headers(response.headers, target_url)
             findings.extend(security_headers)
             
             # Parse forms for further testing
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Recon only counts forms, so let lxml build just the form subtrees
+            soup = BeautifulSoup(body, 'lxml', parse_only=SoupStrainer('form'))
             forms = soup.find_all('form')
             if forms:
-                findings.append({
-                    'type': 'info',
-                    'severity': 'info',
-                    'title': 'Forms Detected',
-                    'description': f'Found {len(forms)} form(s) on the page',
-                    'details': {'form_count': len(forms)}
-                })
+                findings.append(Finding(
+                    type='info',
+                    severity='info',
+                    title='Forms Detected',
+                    description=f'Found {len(forms)} form(s) on the page',
+                    details={'form_count': len(forms)}
+                ))
                 
         except requests.exceptions.RequestException as e:
-            findings.append({
-                'type': 'error',
-                'severity': 'high',
-                'title': 'Connection Error',
-                'description': f'Could not connect to target: {str(e)}',
-                'details': {}
-            })
+            findings.append(Finding(
+                type='error',
+                severity='high',
+                title='Connection Error',
+                description=f'Could not connect to target: {str(e)}',
+                details={}
+            ))
         
         return findings
     
-    def _check_security_headers(self, headers: Dict, target_url: str) -> List[Dict]:
-        """Check for missing or misconfigured security headers."""
+    def _recon_lite(self, target_url: str, proxies: Optional[Dict],
+                    session: Optional[requests.Session] = None) -> List[Finding]:
+        """
+        Check the target's security headers with a HEAD request, without fetching the body.
+        
+        Args:
+            target_url: The target URL to check
+            proxies: Optional proxy configuration
+            session: Scan session to send the request with; defaults to the base session
+            
+        Returns:
+            Target response and security header findings
+        """
         findings = []
+        session = session or self.session
         
-        security_headers = {
-            'Strict-Transport-Security': {
-                'severity': 'medium',
-                'description': 'HSTS header missing - site vulnerable to SSL stripping attacks'
-            },
-            'Content-Security-Policy': {
-                'severity': 'medium',
-                'description': 'CSP header missing - increases XSS attack surface'
-            },
-            'X-Frame-Options': {
-                'severity': 'medium',
-                'description': 'X-Frame-Options missing - site may be vulnerable to clickjacking'
-            },
-            'X-Content-Type-Options': {
-                'severity': 'low',
-                'description': 'X-Content-Type-Options missing - browser may MIME-sniff content'
-            },
-            'Referrer-Policy': {
-                'severity': 'low',
-                'description': 'Referrer-Policy missing - referrer information may leak'
-            },
-            'Permissions-Policy': {
-                'severity': 'info',
-                'description': 'Permissions-Policy missing - browser features not restricted'
-            }
-        }
+        try:
+            response = session.head(
+                target_url,
+                proxies=proxies,
+                allow_redirects=True,
+                timeout=10,
+                verify=False
+            )
+            
+            # Some servers refuse HEAD; fall back to the full recon GET for them
+            if response.status_code in (405, 501):
+                return self._perform_recon(target_url, proxies, session)
+            
+            findings.append(Finding(
+                type='info',
+                severity='info',
+                title='Target Response',
+                description=f'Target responded with status code {response.status_code}',
+                details={
+                    'status_code': response.status_code,
+                    'response_time': response.elapsed.total_seconds(),
+                    'server': response.headers.get('Server', 'Unknown'),
+                    'content_type': response.headers.get('Content-Type', 'Unknown')
+                }
+            ))
+            
+            findings.extend(self._check_security_headers(response.headers, target_url))
+            
+        except requests.exceptions.RequestException as e:
+            findings.append(Finding(
+                type='error',
+                severity='high',
+                title='Connection Error',
+                description=f'Could not connect to target: {str(e)}',
+                details={}
+            ))
+        
+        return findings
+    
+    def _check_security_headers(self, headers: Dict, target_url: str) -> List[Finding]:
+        """Check for missing or misconfigured security headers."""
+        findings = []
+        present = {}
         
-        for header, info in security_headers.items():
+        for header, severity, description in _SECURITY_HEADERS:
             if header not in headers:
-                findings.append({
-                    'type': 'security_header',
-                    'severity': info['severity'],
-                    'title': f'Missing {header}',
-                    'description': info['description'],
-                    'details': {'header': header, 'present': False}
-                })
+                findings.append(Finding(
+                    type='security_header',
+                    severity=severity,
+                    title=f'Missing {header}',
+                    description=description,
+                    details={'header': header, 'present': False}
+                ))
             else:
-                findings.append({
-                    'type': 'security_header',
-                    'severity': 'info',
-                    'title': f'{header} Present',
-                    'description': f'{header} header is properly configured',
-                    'details': {'header': header, 'value': headers[header], 'present': True}
-                })
+                present[header] = headers[header]
+        
+        # Configured headers need no action, so they share one summary finding
+        if present:
+            findings.append(Finding(
+                type='security_header_summary',
+                severity='info',
+                title='Security Headers Present',
+                description=f'{len(present)} of {len(_SECURITY_HEADERS)} checked security headers are configured: {", ".join(present)}',
+                details={'present': present}
+            ))
         
         return findings
     
-    def _calculate_stats(self, findings: List[Dict]) -> Dict[str, int]:
+    def _calculate_stats(self, findings: List[Finding]) -> Dict[str, int]:
         """Calculate vulnerability statistics."""
-        stats = {
+        severities = Counter(finding.severity for finding in findings)
+        
+        return {
             'total_requests': len(findings),
-            'vulnerabilities_found': 0,
-            'critical': 0,
-            'high': 0,
-            'medium': 0,
-            'low': 0,
-            'info': 0
+            'vulnerabilities_found': severities['critical'] + severities['high'] + severities['medium'],
+            'critical': severities['critical'],
+            'high': severities['high'],
+            'medium': severities['medium'],
+            'low': severities['low'],
+            'info': severities['info']
         }
+    
+    def _update_status(self, scan_id: str, status: str, message: str,
+                       progress: Optional[int] = None):
+        """
+        Update scan status with message.
         
-        for finding in findings:
-            severity = finding.get('severity', 'info')
-            if severity in stats:
-                stats[severity] += 1
-            
-            if severity in ['critical', 'high', 'medium']:
-                stats['vulnerabilities_found'] += 1
-        
-        return stats
+        Args:
+            scan_id: Scan identifier
+            status: New scan status
+            message: Human-readable progress message
+            progress: Percentage of scan phases finished, if it changed
+        """
+        with self._lock:
+            if scan_id in self.active_scans:
+                self.active_scans[scan_id]['status'] = status
+                self.active_scans[scan_id]['current_message'] = message
+                self.active_scans[scan_id]['last_update_ts'] = time.time()
+                if progress is not None:
+                    self.active_scans[scan_id]['progress'] = progress
     
-    def _update_status(self, scan_id: str, status: str, message: str):
-        """Update scan status with message."""
-        if scan_id in self.active_scans:
-            self.active_scans[scan_id]['status'] = status
-            self.active_scans[scan_id]['current_message'] = message
-            self.active_scans[scan_id]['last_update'] = datetime.now().isoformat()
+    @staticmethod
+    def _serialize_scan(scan_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the external form of a scan, with ISO 8601 timestamps and plain-dict findings.
+        
+        Args:
+            scan_info: Internal scan dictionary holding epoch timestamps and Finding objects
+            
+        Returns:
+            Shallow copy safe to serialize while the scan keeps running
+        """
+        data = dict(scan_info)
+        data['findings'] = [finding.to_dict() for finding in data['findings']]
+        for ts_key, iso_key in _TIMESTAMP_FIELDS:
+            ts = data.pop(ts_key, None)
+            if ts is not None:
+                data[iso_key] = datetime.fromtimestamp(ts).isoformat()
+        return data
     
     def get_scan_status(self, scan_id: str) -> Dict[str, Any]:
         """Get current status of a scan."""
-        if scan_id in self.active_scans:
-            return self.active_scans[scan_id]
-        
-        # Check history
-        for scan in self.scan_history:
-            if scan['scan_id'] == scan_id:
-                return scan
+        with self._lock:
+            if scan_id in self.active_scans:
+                return self._serialize_scan(self.active_scans[scan_id])
+            
+            # Check history, newest first since recent scans are polled most
+            for record in reversed(self.scan_history):
+                if record['scan_id'] == scan_id:
+                    return record
         
         return {'error': 'Scan not found'}
     
-    def get_scan_history(self) -> List[Dict]:
-        """Get all scan history."""
-        return self.scan_history
+    def get_scan_history(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Dict]:
+        """
+        Get finished scans, either all of them or one page.
+        
+        Without limit or offset the whole history is returned oldest first, as it
+        always was. Passing either pages through it newest first instead.
+        
+        Args:
+            limit: Maximum number of scans in the page; None returns all remaining
+            offset: Number of newest scans to skip
+            
+        Returns:
+            List of serialized scan records
+        """
+        with self._lock:
+            if limit is None and offset is None:
+                return list(self.scan_history)
+            
+            start = offset or 0
+            stop = None if limit is None else start + limit
+            # Only the requested page is walked and copied, not the whole history
+            return list(islice(reversed(self.scan_history), start, stop))
+    
+    def get_history_count(self) -> int:
+        """Get the number of completed scans held in history."""
+        with self._lock:
+            return len(self.scan_history)
     
-    def _save_scan_history(self):
-        """Save scan history to file."""
+    def _save_scan_history(self, record: Dict[str, Any]):
+        """Append a serialized scan to the JSON Lines history file."""
         try:
-            history_file = os.path.join('logs', 'scan_history.json')
+            # One line per scan, so saving never rewrites earlier scans
+            history_file = os.path.join('logs', 'scan_history.jsonl')
             os.makedirs('logs', exist_ok=True)
-            with open(history_file, 'w') as f:
-                json.dump(self.scan_history, f, indent=2)
+            with open(history_file, 'ab') as f:
+                f.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+        except Exception:
+            pass  # Fail silently for history saving
+    
+    def _save_scan_record(self, record: Dict[str, Any]):
+        """Save a serialized scan to its own file so it can be loaded by ID without reading the history."""
+        try:
+            scans_dir = os.path.join('logs', 'scans')
+            os.makedirs(scans_dir, exist_ok=True)
+            with open(os.path.join(scans_dir, f"{record['scan_id']}.json"), 'wb') as f:
+                f.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS))
         except Exception:
             pass  # Fail silently for history saving
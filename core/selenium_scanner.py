@@ -4,24 +4,61 @@ Browser-based security testing using Selenium WebDriver.
 """
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, NoAlertPresentException, UnexpectedAlertPresentException
-from typing import Dict, List, Any, Optional
-import time
+from selenium.common.exceptions import TimeoutException, UnexpectedAlertPresentException
+from typing import List, Any, Optional
+import os
+import threading
 import re
 
+from .findings import Finding
+
+# webdriver-manager logs every install() call; keep scans quiet unless configured otherwise
+os.environ.setdefault('WDM_LOG_LEVEL', '0')
+
+# Heavy static resources blocked during scans. Blocking at the network layer
+# still fires error events, so onerror-based XSS payloads keep working
+_BLOCKED_RESOURCE_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.bmp', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3', '*.ogg'
+]
+
+# Storage keys whose names suggest they hold secrets
+_SENSITIVE_KEY_RE = re.compile(r'password|token|secret|key|auth|credential|session', re.I)
+
 
 class SeleniumScanner:
     """Browser-based security scanner using Selenium."""
     
+    # ChromeDriver path resolved once per process and shared by all instances
+    _DRIVER_PATH = None
+    _DRIVER_PATH_LOCK = threading.Lock()
+    
     def __init__(self):
         self.driver = None
         self.timeout = 10
+        self.page_load_timeout = 30
+    
+    @classmethod
+    def _get_driver_path(cls) -> str:
+        """
+        Resolve the ChromeDriver executable, downloading it on first use.
+        
+        Returns:
+            Path to the ChromeDriver binary
+        """
+        # install() checks the remote driver version on every call, so only
+        # the first scan in the process pays for it
+        if cls._DRIVER_PATH is None:
+            with cls._DRIVER_PATH_LOCK:
+                if cls._DRIVER_PATH is None:
+                    cls._DRIVER_PATH = ChromeDriverManager().install()
+        return cls._DRIVER_PATH
         
     def _init_driver(self, proxy: Optional[str] = None):
         """Initialize Chrome WebDriver with options."""
@@ -34,6 +71,14 @@ class SeleniumScanner:
         chrome_options.add_argument('--user-agent=WebSecTester/1.0 Security Scanner')
         chrome_options.add_argument('--ignore-certificate-errors')
         chrome_options.add_argument('--allow-insecure-localhost')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.default_content_setting_values.notifications': 2,
+            'profile.managed_default_content_settings.media_stream': 2
+        })
+        # get() returns at DOMContentLoaded; _load() still waits for the full load
+        chrome_options.page_load_strategy = 'eager'
         
         if proxy:
             chrome_options.add_argument(f'--proxy-server={proxy}')
@@ -42,13 +87,44 @@ class SeleniumScanner:
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(self._get_driver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.set_page_load_timeout(30)
+            self.driver.set_page_load_timeout(self.page_load_timeout)
         except Exception as e:
             raise Exception(f"Failed to initialize Chrome driver: {str(e)}")
+        
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_RESOURCE_PATTERNS})
+        except Exception:
+            pass  # Resource blocking only speeds up page loads; scans work without it
     
-    def scan(self, target_url: str, proxy: Optional[str] = None) -> List[Dict]:
+    def _load(self, url: str, stop_on_alert: bool = False):
+        """
+        Navigate to a URL and wait for the document to finish loading.
+        
+        The wait for the load event gets the same budget as a normal page load.
+        If the load event still has not fired, the checks run against the parsed,
+        interactive DOM rather than failing.
+        
+        Args:
+            url: URL to load in the current driver
+            stop_on_alert: Stop waiting as soon as a JavaScript alert opens, leaving
+                it for the caller; running scripts with an alert open would dismiss it
+        """
+        def loaded(driver):
+            if stop_on_alert and EC.alert_is_present()(driver):
+                return True
+            return driver.execute_script('return document.readyState') == 'complete'
+        
+        # With the eager strategy get() returns once the DOM is parsed
+        self.driver.get(url)
+        try:
+            WebDriverWait(self.driver, self.page_load_timeout).until(loaded)
+        except TimeoutException:
+            pass
+    
+    def scan(self, target_url: str, proxy: Optional[str] = None) -> List[Finding]:
         """
         Perform browser-based security scan.
         
@@ -68,30 +144,38 @@ class SeleniumScanner:
             dom_xss_results = self._test_dom_xss(target_url)
             findings.extend(dom_xss_results)
             
+            # The remaining checks only inspect the page, so load it once and share
+            # the DOM; if that fails each check loads the page and reports its own error
+            try:
+                self._load(target_url)
+                loaded = True
+            except Exception:
+                loaded = False
+            
             # 2. Check for mixed content
-            mixed_content_results = self._check_mixed_content(target_url)
+            mixed_content_results = self._check_mixed_content(target_url, skip_load=loaded)
             findings.extend(mixed_content_results)
             
             # 3. Check for insecure forms
-            insecure_forms_results = self._check_insecure_forms(target_url)
+            insecure_forms_results = self._check_insecure_forms(target_url, skip_load=loaded)
             findings.extend(insecure_forms_results)
             
             # 4. Test for clickjacking protection
-            clickjacking_results = self._test_clickjacking(target_url)
+            clickjacking_results = self._test_clickjacking(target_url, skip_load=loaded)
             findings.extend(clickjacking_results)
             
             # 5. Client-side storage check
-            storage_results = self._check_client_storage(target_url)
+            storage_results = self._check_client_storage(target_url, skip_load=loaded)
             findings.extend(storage_results)
             
         except Exception as e:
-            findings.append({
-                'type': 'error',
-                'severity': 'info',
-                'title': 'Selenium Scan Error',
-                'description': f'Error during browser scan: {str(e)}',
-                'details': {}
-            })
+            findings.append(Finding(
+                type='error',
+                severity='info',
+                title='Selenium Scan Error',
+                description=f'Error during browser scan: {str(e)}',
+                details={}
+            ))
         finally:
             if self.driver:
                 try:
@@ -102,37 +186,54 @@ class SeleniumScanner:
         
         return findings
     
-    def _test_dom_xss(self, target_url: str) -> List[Dict]:
+    def _wait_for_alert(self, timeout: float = 0.5):
+        """
+        Wait briefly for a JavaScript alert to open.
+        
+        Args:
+            timeout: Seconds to wait before concluding no payload fired
+            
+        Returns:
+            The open alert, or None if none appeared
+        """
+        try:
+            return WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+        except TimeoutException:
+            return None
+    
+    def _test_dom_xss(self, target_url: str) -> List[Finding]:
         """Test for DOM-based XSS vulnerabilities."""
         findings = []
         
         try:
             # Test with hash-based XSS
             test_url = f"{target_url}#<img src=x onerror=alert(1)>"
-            self.driver.get(test_url)
-            time.sleep(2)
-            
-            # Check if alert was triggered
-            try:
-                alert = self.driver.switch_to.alert
+            # Wait for the full load as well: get() returns at DOMContentLoaded,
+            # before load handlers, late scripts and onerror image fetches have run
+            self._load(test_url, stop_on_alert=True)
+            
+            # Check if alert was triggered, allowing scripts started by the load
+            # event the same grace period the scanner always gave them
+            alert = self._wait_for_alert(timeout=2)
+            if alert is not None:
                 alert_text = alert.text
                 alert.accept()
-                findings.append({
-                    'type': 'dom_xss',
-                    'severity': 'critical',
-                    'title': 'DOM-based XSS Vulnerability',
-                    'description': 'DOM-based XSS detected - JavaScript executed from URL hash',
-                    'details': {
+                findings.append(Finding(
+                    type='dom_xss',
+                    severity='critical',
+                    title='DOM-based XSS Vulnerability',
+                    description='DOM-based XSS detected - JavaScript executed from URL hash',
+                    details={
                         'payload': '<img src=x onerror=alert(1)>',
                         'url': test_url,
                         'alert_text': alert_text
                     },
-                    'remediation': 'Sanitize all user input before inserting into DOM. Use textContent instead of innerHTML.'
-                })
-            except NoAlertPresentException:
-                pass
+                    remediation='Sanitize all user input before inserting into DOM. Use textContent instead of innerHTML.'
+                ))
             
-            # Test location.hash manipulation
+            # Test location.hash manipulation. The page is already loaded, and a
+            # fragment-only change never reloads it, so assign the hash in place
+            # and let the page's hashchange handling pick up each payload
             hash_payloads = [
                 "#'-alert(1)-'",
                 "#<script>alert(1)</script>",
@@ -142,181 +243,186 @@ class SeleniumScanner:
             for payload in hash_payloads:
                 try:
                     test_url = f"{target_url}{payload}"
-                    self.driver.get(test_url)
-                    time.sleep(1)
+                    self.driver.execute_script('location.hash = arguments[0];', payload)
                     
-                    try:
-                        alert = self.driver.switch_to.alert
+                    alert = self._wait_for_alert()
+                    if alert is not None:
                         alert.accept()
-                        findings.append({
-                            'type': 'dom_xss',
-                            'severity': 'critical',
-                            'title': 'DOM-based XSS via Location Hash',
-                            'description': f'XSS payload executed from URL hash',
-                            'details': {
+                        findings.append(Finding(
+                            type='dom_xss',
+                            severity='critical',
+                            title='DOM-based XSS via Location Hash',
+                            description=f'XSS payload executed from URL hash',
+                            details={
                                 'payload': payload,
                                 'url': test_url
                             },
-                            'remediation': 'Validate and sanitize location.hash before using in DOM operations.'
-                        })
+                            remediation='Validate and sanitize location.hash before using in DOM operations.'
+                        ))
                         break
-                    except NoAlertPresentException:
-                        continue
                         
                 except Exception:
                     continue
                     
         except Exception as e:
-            findings.append({
-                'type': 'info',
-                'severity': 'info',
-                'title': 'DOM XSS Test Incomplete',
-                'description': f'Could not complete DOM XSS testing: {str(e)}',
-                'details': {}
-            })
+            findings.append(Finding(
+                type='info',
+                severity='info',
+                title='DOM XSS Test Incomplete',
+                description=f'Could not complete DOM XSS testing: {str(e)}',
+                details={}
+            ))
         
         return findings
     
-    def _check_mixed_content(self, target_url: str) -> List[Dict]:
+    def _check_mixed_content(self, target_url: str, skip_load: bool = False) -> List[Finding]:
         """Check for mixed content (HTTP resources on HTTPS page)."""
         findings = []
         
         try:
-            self.driver.get(target_url)
-            time.sleep(2)
+            if not skip_load:
+                self._load(target_url)
             
             # Get current URL protocol
             current_url = self.driver.current_url
             is_https = current_url.startswith('https')
             
             if not is_https:
-                findings.append({
-                    'type': 'info',
-                    'severity': 'info',
-                    'title': 'Not HTTPS',
-                    'description': 'Target is not using HTTPS',
-                    'details': {'url': current_url}
-                })
+                findings.append(Finding(
+                    type='info',
+                    severity='info',
+                    title='Not HTTPS',
+                    description='Target is not using HTTPS',
+                    details={'url': current_url}
+                ))
                 return findings
             
-            # Check for HTTP resources
-            http_resources = []
-            
-            # Check images
-            images = self.driver.find_elements(By.TAG_NAME, 'img')
-            for img in images:
-                src = img.get_attribute('src')
-                if src and src.startswith('http:'):
-                    http_resources.append({'type': 'image', 'src': src})
-            
-            # Check scripts
-            scripts = self.driver.find_elements(By.TAG_NAME, 'script')
-            for script in scripts:
-                src = script.get_attribute('src')
-                if src and src.startswith('http:'):
-                    http_resources.append({'type': 'script', 'src': src})
-            
-            # Check stylesheets
-            links = self.driver.find_elements(By.TAG_NAME, 'link')
-            for link in links:
-                rel = link.get_attribute('rel')
-                href = link.get_attribute('href')
-                if rel == 'stylesheet' and href and href.startswith('http:'):
-                    http_resources.append({'type': 'stylesheet', 'href': href})
-            
-            # Check iframes
-            iframes = self.driver.find_elements(By.TAG_NAME, 'iframe')
-            for iframe in iframes:
-                src = iframe.get_attribute('src')
-                if src and src.startswith('http:'):
-                    http_resources.append({'type': 'iframe', 'src': src})
+            # Collect every HTTP resource in one script call instead of a
+            # WebDriver round-trip per element and attribute
+            http_resources = self.driver.execute_script("""
+                var out = [];
+                function collect(selector, type, attr) {
+                    document.querySelectorAll(selector).forEach(function (el) {
+                        var url = el[attr];
+                        if (url && url.indexOf('http:') === 0) {
+                            var item = {type: type};
+                            item[attr] = url;
+                            out.push(item);
+                        }
+                    });
+                }
+                collect('img[src]', 'image', 'src');
+                collect('script[src]', 'script', 'src');
+                collect('link[rel="stylesheet"][href]', 'stylesheet', 'href');
+                collect('iframe[src]', 'iframe', 'src');
+                return out;
+            """)
             
             if http_resources:
-                findings.append({
-                    'type': 'mixed_content',
-                    'severity': 'medium',
-                    'title': 'Mixed Content Detected',
-                    'description': f'Found {len(http_resources)} HTTP resource(s) on HTTPS page',
-                    'details': {
+                findings.append(Finding(
+                    type='mixed_content',
+                    severity='medium',
+                    title='Mixed Content Detected',
+                    description=f'Found {len(http_resources)} HTTP resource(s) on HTTPS page',
+                    details={
                         'count': len(http_resources),
                         'resources': http_resources[:5]  # Limit to first 5
                     },
-                    'remediation': 'Load all resources over HTTPS. Use protocol-relative URLs or always use HTTPS.'
-                })
+                    remediation='Load all resources over HTTPS. Use protocol-relative URLs or always use HTTPS.'
+                ))
             
         except Exception as e:
-            findings.append({
-                'type': 'info',
-                'severity': 'info',
-                'title': 'Mixed Content Check Incomplete',
-                'description': f'Could not complete mixed content check: {str(e)}',
-                'details': {}
-            })
+            findings.append(Finding(
+                type='info',
+                severity='info',
+                title='Mixed Content Check Incomplete',
+                description=f'Could not complete mixed content check: {str(e)}',
+                details={}
+            ))
         
         return findings
     
-    def _check_insecure_forms(self, target_url: str) -> List[Dict]:
+    def _check_insecure_forms(self, target_url: str, skip_load: bool = False) -> List[Finding]:
         """Check for forms submitting to HTTP on HTTPS pages."""
         findings = []
         
         try:
-            self.driver.get(target_url)
-            time.sleep(2)
-            
-            current_url = self.driver.current_url
-            is_https = current_url.startswith('https')
-            
-            forms = self.driver.find_elements(By.TAG_NAME, 'form')
-            insecure_forms = []
-            
-            for form in forms:
-                action = form.get_attribute('action') or ''
-                if action.startswith('http:') or (not action and not is_https):
-                    form_html = form.get_attribute('outerHTML')[:200]
-                    insecure_forms.append({
-                        'action': action or 'Current page (insecure)',
-                        'html_snippet': form_html
-                    })
+            if not skip_load:
+                self._load(target_url)
+            
+            # Read forms and password fields in a single round-trip. Insecure
+            # forms are picked out in the page so outerHTML is only serialized
+            # for the ones that get reported
+            # The action is the resolved form.action URL, as WebDriver's
+            # get_attribute() returned, so relative actions on an HTTP page count.
+            # A child <input name="action"> shadows the property, so fall back to
+            # resolving the attribute by hand
+            page_forms = self.driver.execute_script("""
+                var insecure = [];
+                Array.prototype.forEach.call(document.forms, function (form) {
+                    var raw = form.getAttribute('action');
+                    var action = form.action;
+                    if (typeof action !== 'string') {
+                        try {
+                            action = new URL(raw || '', document.baseURI).href;
+                        } catch (e) {
+                            action = '';
+                        }
+                    }
+                    if (action.indexOf('http:') === 0) {
+                        insecure.push({
+                            action: raw === null ? 'Current page (insecure)' : action,
+                            html_snippet: form.outerHTML.slice(0, 200)
+                        });
+                    }
+                });
+                return {
+                    insecure_forms: insecure,
+                    password_autocomplete: Array.prototype.map.call(
+                        document.querySelectorAll('input[type="password"]'),
+                        function (input) { return input.getAttribute('autocomplete'); }
+                    )
+                };
+            """)
+            insecure_forms = page_forms['insecure_forms']
             
             if insecure_forms:
-                findings.append({
-                    'type': 'insecure_form',
-                    'severity': 'high',
-                    'title': 'Insecure Form Submission',
-                    'description': f'Found {len(insecure_forms)} form(s) submitting to HTTP',
-                    'details': {
+                findings.append(Finding(
+                    type='insecure_form',
+                    severity='high',
+                    title='Insecure Form Submission',
+                    description=f'Found {len(insecure_forms)} form(s) submitting to HTTP',
+                    details={
                         'count': len(insecure_forms),
                         'forms': insecure_forms[:3]
                     },
-                    'remediation': 'Ensure all forms submit to HTTPS endpoints.'
-                })
+                    remediation='Ensure all forms submit to HTTPS endpoints.'
+                ))
             
             # Check for password/autocomplete on sensitive fields
-            password_inputs = self.driver.find_elements(By.XPATH, "//input[@type='password']")
-            for pwd_input in password_inputs:
-                autocomplete = pwd_input.get_attribute('autocomplete')
+            for autocomplete in page_forms['password_autocomplete']:
                 if not autocomplete or autocomplete == 'on':
-                    findings.append({
-                        'type': 'password_security',
-                        'severity': 'low',
-                        'title': 'Password Field Autocomplete',
-                        'description': 'Password field may have autocomplete enabled',
-                        'details': {'autocomplete': autocomplete or 'not set'},
-                        'remediation': 'Set autocomplete="new-password" or autocomplete="current-password" appropriately.'
-                    })
+                    findings.append(Finding(
+                        type='password_security',
+                        severity='low',
+                        title='Password Field Autocomplete',
+                        description='Password field may have autocomplete enabled',
+                        details={'autocomplete': autocomplete or 'not set'},
+                        remediation='Set autocomplete="new-password" or autocomplete="current-password" appropriately.'
+                    ))
             
         except Exception as e:
-            findings.append({
-                'type': 'info',
-                'severity': 'info',
-                'title': 'Form Security Check Incomplete',
-                'description': f'Could not complete form security check: {str(e)}',
-                'details': {}
-            })
+            findings.append(Finding(
+                type='info',
+                severity='info',
+                title='Form Security Check Incomplete',
+                description=f'Could not complete form security check: {str(e)}',
+                details={}
+            ))
         
         return findings
     
-    def _test_clickjacking(self, target_url: str) -> List[Dict]:
+    def _test_clickjacking(self, target_url: str, skip_load: bool = False) -> List[Finding]:
         """Test for clickjacking vulnerability."""
         findings = []
         
@@ -333,7 +439,8 @@ class SeleniumScanner:
             """
             
             # We can't directly test this, but we can check for X-Frame-Options
-            self.driver.get(target_url)
+            if not skip_load:
+                self._load(target_url)
             
             # Try to execute script to check frame busting
             frame_busting = self.driver.execute_script("""
@@ -346,94 +453,89 @@ class SeleniumScanner:
             # Since we're not in a frame, this won't help much
             # Instead, we'll rely on the security headers check
             
-            findings.append({
-                'type': 'clickjacking',
-                'severity': 'info',
-                'title': 'Clickjacking Test',
-                'description': 'Clickjacking protection should be verified via security headers',
-                'details': {'note': 'Check X-Frame-Options and CSP frame-ancestors in security headers scan'},
-                'remediation': 'Implement X-Frame-Options: DENY or SAMEORIGIN, or CSP frame-ancestors directive.'
-            })
+            findings.append(Finding(
+                type='clickjacking',
+                severity='info',
+                title='Clickjacking Test',
+                description='Clickjacking protection should be verified via security headers',
+                details={'note': 'Check X-Frame-Options and CSP frame-ancestors in security headers scan'},
+                remediation='Implement X-Frame-Options: DENY or SAMEORIGIN, or CSP frame-ancestors directive.'
+            ))
             
         except Exception as e:
-            findings.append({
-                'type': 'info',
-                'severity': 'info',
-                'title': 'Clickjacking Test Incomplete',
-                'description': f'Could not complete clickjacking test: {str(e)}',
-                'details': {}
-            })
+            findings.append(Finding(
+                type='info',
+                severity='info',
+                title='Clickjacking Test Incomplete',
+                description=f'Could not complete clickjacking test: {str(e)}',
+                details={}
+            ))
         
         return findings
     
-    def _check_client_storage(self, target_url: str) -> List[Dict]:
+    def _check_client_storage(self, target_url: str, skip_load: bool = False) -> List[Finding]:
         """Check for sensitive data in client-side storage."""
         findings = []
         
         try:
-            self.driver.get(target_url)
-            time.sleep(2)
-            
-            # Check localStorage
-            local_storage = self.driver.execute_script("""
-                var items = {};
-                for (var i = 0; i < localStorage.length; i++) {
-                    var key = localStorage.key(i);
-                    items[key] = localStorage.getItem(key);
-                }
-                return items;
-            """)
-            
-            # Check sessionStorage
-            session_storage = self.driver.execute_script("""
-                var items = {};
-                for (var i = 0; i < sessionStorage.length; i++) {
-                    var key = sessionStorage.key(i);
-                    items[key] = sessionStorage.getItem(key);
-                }
-                return items;
-            """)
+            if not skip_load:
+                self._load(target_url)
+            
+            # Filter both storages in the browser so only sensitive entries and
+            # key names cross the WebDriver bridge, not every stored value
+            storage = self.driver.execute_script("""
+                var pattern = new RegExp(arguments[0], 'i');
+                var result = {matches: [], localStorage: [], sessionStorage: []};
+                [['localStorage', localStorage], ['sessionStorage', sessionStorage]].forEach(function (entry) {
+                    var name = entry[0], store = entry[1];
+                    for (var i = 0; i < store.length; i++) {
+                        var key = store.key(i);
+                        result[name].push(key);
+                        if (pattern.test(key)) {
+                            var value = store.getItem(key);
+                            result.matches.push({
+                                storage_type: name,
+                                key: key,
+                                value_preview: value.length > 50 ? value.slice(0, 50) + '...' : value
+                            });
+                        }
+                    }
+                });
+                return result;
+            """, _SENSITIVE_KEY_RE.pattern)
+            local_keys = storage['localStorage']
+            session_keys = storage['sessionStorage']
             
             # Check for sensitive data patterns
-            sensitive_patterns = ['password', 'token', 'secret', 'key', 'auth', 'credential', 'session']
-            
-            for key, value in {**local_storage, **session_storage}.items():
-                lower_key = key.lower()
-                for pattern in sensitive_patterns:
-                    if pattern in lower_key:
-                        findings.append({
-                            'type': 'client_storage',
-                            'severity': 'medium',
-                            'title': 'Potentially Sensitive Data in Client Storage',
-                            'description': f'Key "{key}" in storage may contain sensitive data',
-                            'details': {
-                                'storage_type': 'localStorage' if key in local_storage else 'sessionStorage',
-                                'key': key,
-                                'value_preview': str(value)[:50] + '...' if len(str(value)) > 50 else value
-                            },
-                            'remediation': 'Avoid storing sensitive data in client-side storage. Use secure, httpOnly cookies instead.'
-                        })
-                        break
-            
-            if local_storage or session_storage:
-                findings.append({
-                    'type': 'info',
-                    'severity': 'info',
-                    'title': 'Client Storage Detected',
-                    'description': f'Found {len(local_storage)} localStorage and {len(session_storage)} sessionStorage items',
-                    'details': {
-                        'localStorage_keys': list(local_storage.keys()),
-                        'sessionStorage_keys': list(session_storage.keys())
+            for match in storage['matches']:
+                findings.append(Finding(
+                    type='client_storage',
+                    severity='medium',
+                    title='Potentially Sensitive Data in Client Storage',
+                    description=f'Key "{match["key"]}" in storage may contain sensitive data',
+                    details=match,
+                    remediation='Avoid storing sensitive data in client-side storage. Use secure, httpOnly cookies instead.'
+                ))
+            
+            if local_keys or session_keys:
+                findings.append(Finding(
+                    type='info',
+                    severity='info',
+                    title='Client Storage Detected',
+                    description=f'Found {len(local_keys)} localStorage and {len(session_keys)} sessionStorage items',
+                    details={
+                        'localStorage_keys': local_keys,
+                        'sessionStorage_keys': session_keys
                     }
-                })
+                ))
             
         except Exception as e:
-            findings.append({
-                'type': 'info',
-                'severity': 'info',
-                'title': 'Client Storage Check Incomplete',
-                'description': f'Could not complete client storage check: {str(e)}',
-                'details': {}
-            })
+            findings.append(Finding(
+                type='info',
+                severity='info',
+                title='Client Storage Check Incomplete',
+                description=f'Could not complete client storage check: {str(e)}',
+                details={}
+            ))
         
         return findings
@@ -9,16 +9,26 @@ import urllib.parse
 from typing import Dict, List, Any, Optional
 from bs4 import BeautifulSoup
 
+from .findings import Finding
+
 
 class VulnerabilityScanner:
     """Scanner for common web application vulnerabilities."""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.verify = False
-        self.session.headers.update({
-            'User-Agent': 'WebSecTester/1.0 Security Scanner'
-        })
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the vulnerability scanner.
+        
+        Args:
+            session: Optional shared session so probes reuse pooled connections
+        """
+        if session is None:
+            session = requests.Session()
+            session.verify = False
+            session.headers.update({
+                'User-Agent': 'WebSecTester/1.0 Security Scanner'
+            })
+        self.session = session
         
         # Common payloads for testing
         self.xss_payloads = [
@@ -66,7 +76,7 @@ class VulnerabilityScanner:
             r"System.Data.SQLite.SQLiteException"
         ]
     
-    def scan(self, target_url: str, proxies: Optional[Dict] = None) -> List[Dict]:
+    def scan(self, target_url: str, proxies: Optional[Dict] = None) -> List[Finding]:
         """
         Perform vulnerability scan on target URL.
         
@@ -97,17 +107,17 @@ class VulnerabilityScanner:
             findings.extend(other_results)
             
         except requests.exceptions.RequestException as e:
-            findings.append({
-                'type': 'error',
-                'severity': 'info',
-                'title': 'Scan Error',
-                'description': f'Error during vulnerability scan: {str(e)}',
-                'details': {}
-            })
+            findings.append(Finding(
+                type='error',
+                severity='info',
+                title='Scan Error',
+                description=f'Error during vulnerability scan: {str(e)}',
+                details={}
+            ))
         
         return findings
     
-    def _test_xss(self, target_url: str, soup: BeautifulSoup, proxies: Optional[Dict]) -> List[Dict]:
+    def _test_xss(self, target_url: str, soup: BeautifulSoup, proxies: Optional[Dict]) -> List[Finding]:
         """Test for XSS vulnerabilities in forms and URL parameters."""
         findings = []
         
@@ -128,19 +138,19 @@ class VulnerabilityScanner:
                         
                         # Check if payload is reflected
                         if payload in response.text:
-                            findings.append({
-                                'type': 'xss',
-                                'severity': 'high',
-                                'title': 'Reflected XSS Vulnerability',
-                                'description': f'Potential XSS vulnerability found in parameter "{param_name}"',
-                                'details': {
+                            findings.append(Finding(
+                                type='xss',
+                                severity='high',
+                                title='Reflected XSS Vulnerability',
+                                description=f'Potential XSS vulnerability found in parameter "{param_name}"',
+                                details={
                                     'parameter': param_name,
                                     'payload': payload,
                                     'url': test_url,
                                     'evidence': 'Payload was reflected in response'
                                 },
-                                'remediation': 'Implement proper input validation and output encoding. Use Content Security Policy (CSP).'
-                            })
+                                remediation='Implement proper input validation and output encoding. Use Content Security Policy (CSP).'
+                            ))
                             break  # Found vulnerability, move to next parameter
                             
                     except requests.exceptions.RequestException:
@@ -169,19 +179,19 @@ class VulnerabilityScanner:
                             response = self.session.get(form_url, params=data, proxies=proxies, timeout=10)
                         
                         if payload in response.text:
-                            findings.append({
-                                'type': 'xss',
-                                'severity': 'high',
-                                'title': 'Stored/DOM XSS Vulnerability',
-                                'description': f'Potential XSS vulnerability found in form field "{input_name}"',
-                                'details': {
+                            findings.append(Finding(
+                                type='xss',
+                                severity='high',
+                                title='Stored/DOM XSS Vulnerability',
+                                description=f'Potential XSS vulnerability found in form field "{input_name}"',
+                                details={
                                     'form_action': form_url,
                                     'field': input_name,
                                     'payload': payload,
                                     'method': method
                                 },
-                                'remediation': 'Implement proper input validation and output encoding. Sanitize all user input.'
-                            })
+                                remediation='Implement proper input validation and output encoding. Sanitize all user input.'
+                            ))
                             break
                             
                     except requests.exceptions.RequestException:
@@ -189,7 +199,7 @@ class VulnerabilityScanner:
         
         return findings
     
-    def _test_sql_injection(self, target_url: str, soup: BeautifulSoup, proxies: Optional[Dict]) -> List[Dict]:
+    def _test_sql_injection(self, target_url: str, soup: BeautifulSoup, proxies: Optional[Dict]) -> List[Finding]:
         """Test for SQL injection vulnerabilities."""
         findings = []
         
@@ -214,37 +224,37 @@ class VulnerabilityScanner:
                     # Check for SQL error messages
                     for pattern in self.error_patterns:
                         if re.search(pattern, response.text, re.IGNORECASE):
-                            findings.append({
-                                'type': 'sql_injection',
-                                'severity': 'critical',
-                                'title': 'SQL Injection Vulnerability',
-                                'description': f'Potential SQL injection found in parameter "{param_name}"',
-                                'details': {
+                            findings.append(Finding(
+                                type='sql_injection',
+                                severity='critical',
+                                title='SQL Injection Vulnerability',
+                                description=f'Potential SQL injection found in parameter "{param_name}"',
+                                details={
                                     'parameter': param_name,
                                     'payload': payload,
                                     'url': test_url,
                                     'evidence': f'Database error pattern detected: {pattern}'
                                 },
-                                'remediation': 'Use parameterized queries/prepared statements. Implement proper input validation.'
-                            })
+                                remediation='Use parameterized queries/prepared statements. Implement proper input validation.'
+                            ))
                             return findings  # Stop after finding SQLi
                     
                     # Check for time-based blind SQLi
                     if 'SLEEP' in payload or 'sleep' in payload:
                         if response.elapsed.total_seconds() > 4:
-                            findings.append({
-                                'type': 'sql_injection',
-                                'severity': 'critical',
-                                'title': 'Blind SQL Injection (Time-Based)',
-                                'description': f'Time-based SQL injection detected in parameter "{param_name}"',
-                                'details': {
+                            findings.append(Finding(
+                                type='sql_injection',
+                                severity='critical',
+                                title='Blind SQL Injection (Time-Based)',
+                                description=f'Time-based SQL injection detected in parameter "{param_name}"',
+                                details={
                                     'parameter': param_name,
                                     'payload': payload,
                                     'response_time': response.elapsed.total_seconds(),
                                     'url': test_url
                                 },
-                                'remediation': 'Use parameterized queries/prepared statements. Avoid dynamic SQL.'
-                            })
+                                remediation='Use parameterized queries/prepared statements. Avoid dynamic SQL.'
+                            ))
                             return findings
                             
                 except requests.exceptions.RequestException:
@@ -253,7 +263,7 @@ class VulnerabilityScanner:
         return findings
     
     def _test_other_vulnerabilities(self, target_url: str, soup: BeautifulSoup, 
-                                    proxies: Optional[Dict]) -> List[Dict]:
+                                    proxies: Optional[Dict]) -> List[Finding]:
         """Test for other common vulnerabilities."""
         findings = []
         
@@ -275,18 +285,18 @@ class VulnerabilityScanner:
                     if response.status_code in [301, 302, 303, 307, 308]:
                         location = response.headers.get('Location', '')
                         if 'evil.com' in location:
-                            findings.append({
-                                'type': 'open_redirect',
-                                'severity': 'medium',
-                                'title': 'Open Redirect Vulnerability',
-                                'description': f'Potential open redirect found in parameter "{param_name}"',
-                                'details': {
+                            findings.append(Finding(
+                                type='open_redirect',
+                                severity='medium',
+                                title='Open Redirect Vulnerability',
+                                description=f'Potential open redirect found in parameter "{param_name}"',
+                                details={
                                     'parameter': param_name,
                                     'payload': 'https://evil.com',
                                     'redirect_location': location
                                 },
-                                'remediation': 'Validate and whitelist redirect URLs. Do not use user input for redirects.'
-                            })
+                                remediation='Validate and whitelist redirect URLs. Do not use user input for redirects.'
+                            ))
                 except requests.exceptions.RequestException:
                     pass
         
@@ -298,17 +308,17 @@ class VulnerabilityScanner:
                 method = form.get('method', 'get').lower()
                 if method == 'post':
                     action = form.get('action', '')
-                    findings.append({
-                        'type': 'csrf',
-                        'severity': 'medium',
-                        'title': 'Missing CSRF Protection',
-                        'description': f'Form may lack CSRF protection: {action}',
-                        'details': {
+                    findings.append(Finding(
+                        type='csrf',
+                        severity='medium',
+                        title='Missing CSRF Protection',
+                        description=f'Form may lack CSRF protection: {action}',
+                        details={
                             'form_action': action,
                             'form_method': method
                         },
-                        'remediation': 'Implement CSRF tokens for all state-changing operations.'
-                    })
+                        remediation='Implement CSRF tokens for all state-changing operations.'
+                    ))
         
         # Check for information disclosure in comments
         comments = soup.find_all(string=lambda text: isinstance(text, str) and '<!--' in text)
@@ -317,17 +327,17 @@ class VulnerabilityScanner:
             lower_comment = comment.lower()
             for pattern in sensitive_patterns:
                 if pattern in lower_comment:
-                    findings.append({
-                        'type': 'info_disclosure',
-                        'severity': 'low',
-                        'title': 'Sensitive Information in HTML Comment',
-                        'description': f'Potential sensitive information found in HTML comment',
-                        'details': {
+                    findings.append(Finding(
+                        type='info_disclosure',
+                        severity='low',
+                        title='Sensitive Information in HTML Comment',
+                        description=f'Potential sensitive information found in HTML comment',
+                        details={
                             'keyword': pattern,
                             'context': comment[:200]
                         },
-                        'remediation': 'Remove sensitive information from HTML comments before deployment.'
-                    })
+                        remediation='Remove sensitive information from HTML comments before deployment.'
+                    ))
                     break
         
         return findings